@@ -1,11 +1,15 @@
-from ninja import Router, Schema
-from ninja.pagination import paginate
+from ninja import Query, Router, Schema
+from ninja.pagination import LimitOffsetPagination
 from ninja.security import HttpBasicAuth
 from datetime import date, datetime
 from django.contrib.auth import authenticate
+from django.db import transaction
+from django.utils import timezone
 from .models import Goal, Reps
-from .tally import Tally
-from django.shortcuts import get_object_or_404, get_list_or_404
+from .renderers import json_response
+from .views import goal_results_columns, goal_status_v2
+from django.http import Http404
+from django.shortcuts import get_object_or_404
 
 router = Router()
 
@@ -38,6 +42,11 @@ class RepsSchema(Schema):
     notes: str | None
 
 
+class PagedRepsSchema(Schema):
+    items: list[RepsSchema]
+    count: int
+
+
 class NewRepSchema(Schema):
     date: datetime
     count: int
@@ -46,7 +55,10 @@ class NewRepSchema(Schema):
 
 @router.get("/goals", response=list[GoalSchema])
 def get_goals(request):
-    return Goal.objects.all()
+    # rows are rendered as-is, the response schema is only used for the docs
+    return json_response(
+        list(Goal.objects.values("goal_id", "goal", "target", "notes"))
+    )
 
 
 @router.get("/goals/{int:goal_id}", response=GoalSchema)
@@ -55,6 +67,7 @@ def get_goal(request, goal_id: int):
 
 
 @router.post("/goals", auth=BasicAuth(), response=GoalSchema)
+@transaction.atomic
 def create_goal(request, new_goal: NewGoalSchema):
     return Goal.objects.create(
         goal=new_goal.goal, target=new_goal.target, notes=new_goal.notes
@@ -62,16 +75,30 @@ def create_goal(request, new_goal: NewGoalSchema):
 
 
 @router.delete("/goals/{int:goal_id}", auth=BasicAuth())
+@transaction.atomic
 def delete_goal(request, goal_id: int):
     goal = get_object_or_404(Goal, goal_id=goal_id)
     goal.delete()
     return None
 
 
-@router.get("/goals/{int:goal_id}/reps", response=list[RepsSchema])
-@paginate
-def get_reps(request, goal_id: int):
-    return get_list_or_404(Reps.objects.order_by("-date"), goal_id=goal_id)
+@router.get("/goals/{int:goal_id}/reps", response=PagedRepsSchema)
+def get_reps(
+    request, goal_id: int, pagination: Query[LimitOffsetPagination.Input]
+):
+    # rows are rendered as-is, the response schema is only used for the docs
+    reps = (
+        Reps.objects.filter(goal_id=goal_id)
+        .order_by("-date")
+        .values("goal_id", "rep_id", "date", "count", "notes")
+    )
+    count = reps.count()
+    if not count:
+        raise Http404
+    offset = pagination.offset
+    return json_response(
+        {"items": list(reps[offset : offset + pagination.limit]), "count": count}
+    )
 
 
 @router.get("/goals/{int:goal_id}/reps/{int:rep_id}", response=RepsSchema)
@@ -80,6 +107,7 @@ def get_rep(request, goal_id: int, rep_id: int):
 
 
 @router.post("/goals/{int:goal_id}/reps", auth=BasicAuth(), response=RepsSchema)
+@transaction.atomic
 def create_rep(request, goal_id: int, new_rep: NewRepSchema):
     goal = get_object_or_404(Goal, goal_id=goal_id)
     return goal.reps_set.create(
@@ -88,6 +116,7 @@ def create_rep(request, goal_id: int, new_rep: NewRepSchema):
 
 
 @router.delete("/goals/{int:goal_id}/reps/{int:rep_id}", auth=BasicAuth())
+@transaction.atomic
 def delete_rep(request, goal_id: int, rep_id: int):
     rep = get_object_or_404(Reps, goal_id=goal_id, rep_id=rep_id)
     rep.delete()
@@ -102,7 +131,13 @@ def get_goal_status(request, goal_id: int):
 
 @router.get("/goals/{int:goal_id}/status-v2")
 def get_goal_status_v2(request, goal_id: int):
-    today = date.today()
+    today = timezone.localdate()
+    goal = get_object_or_404(Goal, goal_id=goal_id)
+    return goal_status_v2(goal, today)
+
+
+@router.get("/goals/{int:goal_id}/results")
+def get_goal_results(request, goal_id: int):
+    today = timezone.localdate()
     goal = get_object_or_404(Goal, goal_id=goal_id)
-    tally = Tally.from_reps(goal.reps_set.all(), goal.target, today)
-    return tally.status_v2(today, goal.target)
+    return goal_results_columns(goal, today)
@@ -0,0 +1,21 @@
+from datetime import date
+from typing import Callable, TypeVar
+from django.core.cache import cache
+from .models import Goal
+
+T = TypeVar("T")
+
+
+def goal_key(goal: Goal, today: date, kind: str) -> str:
+    # cache_token changes on every write to the goal or its reps, so entries
+    # computed before a write are never looked up again and get culled
+    return f"goal:{goal.goal_id}:{goal.cache_token}:{today}:{kind}"
+
+
+def cached(goal: Goal, today: date, kind: str, compute: Callable[[], T]) -> T:
+    key = goal_key(goal, today, kind)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value)
+    return value
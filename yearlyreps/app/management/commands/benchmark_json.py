@@ -0,0 +1,116 @@
+import datetime
+import tempfile
+import timeit
+from unittest import mock
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.urls import resolve
+from django.utils import timezone
+from ninja.renderers import JSONRenderer
+from app.api import RepsSchema
+from app.models import Goal, Reps
+from app import renderers
+from app.renderers import FastJSONRenderer, orjson
+from app.views import goal_status_v2
+from yearlyreps.urls import api
+
+
+def create_goal(name: str, reps: int) -> Goal:
+    goal = Goal.objects.create(goal=name, target=3650, notes="")
+    start = timezone.localdate() - datetime.timedelta(reps // 3)
+    Reps.objects.bulk_create(
+        Reps(
+            goal=goal,
+            date=start + datetime.timedelta(i // 3),
+            count=i % 7 + 1,
+            notes="note" if i % 5 == 0 else None,
+        )
+        for i in range(reps)
+    )
+    return goal
+
+
+class Command(BaseCommand):
+    help = "Compare the default and fast JSON renderers on real API responses"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reps", type=int, default=10000)
+        parser.add_argument("--goals", type=int, default=200)
+        parser.add_argument("--number", type=int, default=20)
+
+    def handle(self, *args, reps=10000, goals=200, number=20, **options):
+        # never touch the configured database or shared cache
+        with tempfile.TemporaryDirectory() as tmp:
+            old_name = connection.settings_dict["NAME"]
+            connection.settings_dict["TEST"]["NAME"] = f"{tmp}/benchmark.db"
+            connection.creation.create_test_db(verbosity=0, autoclobber=True)
+            try:
+                with override_settings(
+                    CACHES={
+                        "default": {
+                            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                            "LOCATION": f"{tmp}/cache",
+                        }
+                    }
+                ):
+                    self.benchmark(reps, goals, number)
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    def benchmark(self, reps, goals, number):
+        self.stdout.write(f"orjson installed: {orjson is not None}")
+        goal = create_goal("benchmark", reps)
+        batch = [create_goal(f"batch {i}", 30) for i in range(goals)]
+        factory = RequestFactory()
+        today = timezone.localdate()
+
+        def endpoint(path, **params):
+            match = resolve(path)
+            request = factory.get(path, params)
+
+            def get(renderer):
+                api.renderer = renderer
+                response = match.func(request, *match.args, **match.kwargs)
+                assert response.status_code == 200, response.content
+                return response
+
+            return get
+
+        def validated_reps(renderer):
+            # the schema validated path get_reps used before
+            rows = Reps.objects.filter(goal_id=goal.goal_id).order_by("-date")
+            items = [RepsSchema.model_validate(rep).model_dump() for rep in rows]
+            return renderer.render(
+                None, {"items": items, "count": len(items)}, response_status=200
+            )
+
+        payload = {g.goal_id: goal_status_v2(g, today) for g in batch}
+
+        def status_batch(renderer):
+            return renderer.render(None, payload, response_status=200)
+
+        cases = [
+            (
+                f"reps listing ({reps} rows)",
+                endpoint(f"/goals/{goal.goal_id}/reps", limit=reps),
+            ),
+            (f"reps listing via RepsSchema ({reps} rows)", validated_reps),
+            (f"status-v2 batch ({goals} goals)", status_batch),
+            ("results", endpoint(f"/goals/{goal.goal_id}/results")),
+        ]
+        for name, case in cases:
+            # views returning json_response() serialize with renderers.dumps,
+            # so the stdlib run also disables orjson there
+            with mock.patch.object(renderers, "orjson", None):
+                stdlib = self.time(case, JSONRenderer(), number)
+            fast = self.time(case, FastJSONRenderer(), number)
+            self.stdout.write(
+                f"{name}: stdlib {1000 * stdlib / number:.2f}ms"
+                f" orjson {1000 * fast / number:.2f}ms"
+                f" ({stdlib / fast:.1f}x)"
+            )
+
+    def time(self, case, renderer, number):
+        case(renderer)  # fill the cache for the cached payloads
+        return timeit.timeit(lambda: case(renderer), number=number)
@@ -0,0 +1,61 @@
+import datetime
+import importlib.util
+import tracemalloc
+from collections import namedtuple
+from django.core.management.base import BaseCommand
+from app import tally as app_tally
+
+Rep = namedtuple("Rep", "date count notes")
+
+
+def history(years: int, per_day: int) -> list[Rep]:
+    start = datetime.date(2015, 1, 1)
+    return [
+        Rep(start + datetime.timedelta(day), (day + i) % 5 + 1, "note" if i else None)
+        for day in range(365 * years)
+        for i in range(per_day)
+    ]
+
+
+def load_tally(path: str):
+    spec = importlib.util.spec_from_file_location("benchmark_tally", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Command(BaseCommand):
+    help = "Measure peak memory of tallying and rendering a long history"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--years", type=int, default=10)
+        parser.add_argument("--per-day", type=int, default=2)
+        parser.add_argument(
+            "--tally",
+            help="path of another tally.py to measure, e.g. an older revision",
+        )
+
+    def handle(self, *args, years=10, per_day=2, tally=None, **options):
+        module = load_tally(tally) if tally else app_tally
+        reps = history(years, per_day)
+        target = 365 * years
+        today = reps[-1].date
+
+        def rows():
+            t = module.Tally.from_reps(reps, target, today)
+            return list(t.results(list(t.dates()), target, today))
+
+        def columns():
+            t = module.Tally.from_reps(reps, target, today)
+            return t.columns(list(t.dates()), target)
+
+        self.stdout.write(f"{len(reps)} reps over {years} years")
+        cases = [("results", rows)]
+        if hasattr(module.Tally, "columns"):
+            cases.append(("columns", columns))
+        for name, case in cases:
+            tracemalloc.start()
+            case()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.stdout.write(f"{name}: peak {peak / 1e6:.2f} MB")
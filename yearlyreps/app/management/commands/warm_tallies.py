@@ -0,0 +1,52 @@
+import time
+from datetime import date
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from app.models import Goal
+from app.views import (
+    goal_recent_status,
+    goal_results_columns,
+    goal_status_html,
+    goal_status_list,
+    goal_status_v2,
+)
+
+
+def warm_goal(goal: Goal, today: date) -> None:
+    goal_recent_status(goal, today)
+    goal_status_html(goal, today)
+    goal_status_list(goal, today)
+    goal_status_v2(goal, today)
+    goal_results_columns(goal, today)
+
+
+class Command(BaseCommand):
+    help = "Precompute goal statuses into the shared cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="keep running, rewarming after each write and date change",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="seconds between checks for changed goals (with --loop)",
+        )
+
+    def handle(self, *args, loop=False, interval=5.0, **options):
+        # goal_id -> (cache_token, date) that was last warmed
+        warmed: dict[int, tuple] = {}
+        while True:
+            today = timezone.localdate()
+            for goal in Goal.objects.all():
+                key = (goal.cache_token, today)
+                if warmed.get(goal.goal_id) != key:
+                    warm_goal(goal, today)
+                    warmed[goal.goal_id] = key
+                    self.stdout.write(f"warmed {goal} for {today}")
+            if not loop:
+                break
+            time.sleep(interval)
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-19 10:00
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="goal",
+            name="cache_token",
+            field=models.UUIDField(default=uuid.uuid4, editable=False),
+        ),
+    ]
@@ -1,4 +1,8 @@
-from django.db import models
+import uuid
+
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
 
 
 class Goal(models.Model):
@@ -6,6 +10,8 @@ class Goal(models.Model):
     goal = models.TextField(blank=False, null=False)
     target = models.IntegerField(blank=True, null=False)
     notes = models.TextField(blank=True, null=False)
+    # regenerated on every change to the goal or its reps, part of the cache key
+    cache_token = models.UUIDField(default=uuid.uuid4, editable=False)
 
     def __str__(self):
         return f"{self.goal} ({self.goal_id})"
@@ -20,3 +26,38 @@ class Reps(models.Model):
 
     def __str__(self):
         return f"{self.date} {self.count} {self.goal} ({self.rep_id})"
+
+    # the rep write and the cache_token update of its goal(s) commit together
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            return super().delete(*args, **kwargs)
+
+
+@receiver(pre_save, sender=Goal)
+def goal_changed(sender, instance, **kwargs):
+    instance.cache_token = uuid.uuid4()
+
+
+@receiver(pre_save, sender=Reps)
+def reps_changing(sender, instance, **kwargs):
+    # remember the goal a rep is being moved from, so it is invalidated too
+    instance._previous_goal_id = (
+        Reps.objects.filter(rep_id=instance.rep_id)
+        .values_list("goal_id", flat=True)
+        .first()
+        if instance.rep_id is not None
+        else None
+    )
+
+
+@receiver(post_save, sender=Reps)
+@receiver(post_delete, sender=Reps)
+def reps_changed(sender, instance, **kwargs):
+    goal_ids = {instance.goal_id, getattr(instance, "_previous_goal_id", None)}
+    Goal.objects.filter(goal_id__in=goal_ids - {None}).update(
+        cache_token=uuid.uuid4()
+    )
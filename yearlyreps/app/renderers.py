@@ -0,0 +1,31 @@
+import json
+from typing import Any
+from django.http import HttpResponse
+from ninja.renderers import JSONRenderer
+from ninja.responses import NinjaJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    return NinjaJSONEncoder().default(obj)
+
+
+def dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, cls=NinjaJSONEncoder).encode()
+
+
+def json_response(data: Any) -> HttpResponse:
+    return HttpResponse(dumps(data), content_type="application/json")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer using orjson when it is installed."""
+
+    def render(self, request, data, *, response_status):
+        return dumps(data)
@@ -8,7 +8,7 @@ from math import floor, ceil
 from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class PeriodResults:
     tally: int
     target: int
@@ -17,6 +17,8 @@ class PeriodResults:
 
 
 class Period:
+    __slots__ = ("name", "window", "count", "status")
+
     def __init__(self, name: str, window: int) -> None:
         self.name = name
         self.window = window
@@ -63,7 +65,7 @@ class Period:
     ) -> PeriodResults:
         classes = []
 
-        count = self.count[date]
+        count = self.count.get(date, 0)
         target2 = self.target((date - min_date).days, target)
 
         if count >= target2:
@@ -75,10 +77,19 @@ class Period:
         if 0 <= age < self.window:
             classes.append("window")
 
-        return PeriodResults(count, target2, self.status[date], classes)
+        return PeriodResults(count, target2, self.status.get(date, 0), classes)
+
+    def columns(
+        self, min_date: datetime.date, dates: List[datetime.date], target: int
+    ) -> Dict[str, List[int]]:
+        return {
+            "tally": [self.count.get(date, 0) for date in dates],
+            "target": [self.target((date - min_date).days, target) for date in dates],
+            "status": [self.status.get(date, 0) for date in dates],
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TallyResults:
     date: datetime.date
     ticked: bool
@@ -88,13 +99,18 @@ class TallyResults:
 
 
 class Tally:
+    __slots__ = ("min", "max", "total", "required", "frequency", "notes", "periods")
+
     def __init__(self) -> None:
         self.min: Optional[datetime.date] = None
         self.max: Optional[datetime.date] = None
         self.total: Dict[datetime.date, int] = defaultdict(int)
         self.required: Dict[datetime.date, int] = defaultdict(int)
         self.frequency: Dict[int, int] = defaultdict(int)
-        self.notes: Dict[datetime.date, List[str]] = defaultdict(list)
+        # raw (count, notes) per rep, only formatted for rendered dates
+        self.notes: Dict[datetime.date, List[Tuple[int, Optional[str]]]] = (
+            defaultdict(list)
+        )
 
         self.periods: List[Period] = [
             Period("Year", 365),
@@ -125,10 +141,7 @@ class Tally:
 
             self.frequency[rep.count] += 1
 
-            self.notes[rep.date].append(str(rep.count))
-
-            if rep.notes is not None:
-                self.notes[rep.date][-1] += f" <span>{rep.notes}</span>"
+            self.notes[rep.date].append((rep.count, rep.notes))
 
             for period in self.periods:
                 period.tally(rep.date, rep.count)
@@ -202,14 +215,13 @@ class Tally:
         self, dates: List[datetime.date], target: int, today: datetime.date
     ) -> Iterator[TallyResults]:
         for date in dates:
-            notes = ", ".join(self.notes[date]) or (
-                f"⇨ {self.required[date]}" if date in self.required else "0"
-            )
+            notes = self.format_notes(date)
+            total = self.total.get(date, 0)
             assert self.min is not None
             yield TallyResults(
                 date,
-                bool(self.total[date]),
-                self.total[date] or self.required[date],
+                bool(total),
+                total or self.required.get(date, 0),
                 notes,
                 [
                     period.results(self.min, date, target, today)
@@ -217,6 +229,35 @@ class Tally:
                 ],
             )
 
+    def format_notes(self, date: datetime.date) -> str:
+        if date in self.notes:
+            return ", ".join(
+                str(count) if notes is None else f"{count} <span>{notes}</span>"
+                for count, notes in self.notes[date]
+            )
+        elif date in self.required:
+            return f"⇨ {self.required[date]}"
+        else:
+            return "0"
+
+    def columns(self, dates: List[datetime.date], target: int) -> Dict[str, Any]:
+        """Column per field rather than an object per date, for JSON output."""
+        min_date = self.min or datetime.date.min
+        return {
+            "date": dates,
+            "ticked": [bool(self.total.get(date, 0)) for date in dates],
+            "total": [
+                self.total.get(date, 0) or self.required.get(date, 0)
+                for date in dates
+            ],
+            "required": [self.required.get(date, 0) for date in dates],
+            "notes": [self.notes.get(date, []) for date in dates],
+            "periods": {
+                period.name: period.columns(min_date, dates, target)
+                for period in self.periods
+            },
+        }
+
     def targets(self, target: int) -> List[Tuple[str, int]]:
         return [
             (period.name, period.target(period.window, target))
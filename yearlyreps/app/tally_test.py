@@ -1,5 +1,10 @@
+import datetime
+from collections import namedtuple
+
 import pytest
-from .tally import Period
+from .tally import Period, Tally
+
+Rep = namedtuple("Rep", "date count notes")
 
 
 @pytest.mark.parametrize(
@@ -14,3 +19,49 @@ def test_weekly_target(
     name: str, window: int, window2: int, target: int, result: int
 ) -> None:
     assert Period(name, window).target(window2, target) == result
+
+
+def test_notes_formatted_for_rendered_dates() -> None:
+    today = datetime.date(2025, 1, 3)
+    reps = [
+        Rep(datetime.date(2025, 1, 1), 3, None),
+        Rep(datetime.date(2025, 1, 1), 2, "evening"),
+    ]
+    tally = Tally.from_reps(reps, 365, today)
+    assert tally.notes[datetime.date(2025, 1, 1)] == [(3, None), (2, "evening")]
+    [row] = tally.results([datetime.date(2025, 1, 1)], 365, today)
+    assert row.notes == "3, 2 <span>evening</span>"
+
+
+def test_columns_match_results() -> None:
+    today = datetime.date(2025, 1, 10)
+    reps = [
+        Rep(datetime.date(2025, 1, 1), 3, None),
+        Rep(datetime.date(2025, 1, 4), 1, "late"),
+    ]
+    tally = Tally.from_reps(reps, 365, today)
+    dates = list(tally.dates())
+    columns = tally.columns(dates, 365)
+    for i, row in enumerate(tally.results(dates, 365, today)):
+        assert columns["date"][i] == row.date
+        assert columns["ticked"][i] == row.ticked
+        assert columns["total"][i] == row.total
+        for name, period in zip(tally.period_names, row.periods):
+            assert columns["periods"][name]["tally"][i] == period.tally
+            assert columns["periods"][name]["target"][i] == period.target
+            assert columns["periods"][name]["status"][i] == period.status
+
+    for i, date in enumerate(dates):
+        assert columns["notes"][i] == tally.notes.get(date, [])
+        assert columns["required"][i] == tally.required.get(date, 0)
+
+    # a rep date: raw pairs in the column, formatted for rendering
+    i = dates.index(datetime.date(2025, 1, 4))
+    assert columns["notes"][i] == [(1, "late")]
+    assert tally.format_notes(dates[i]) == "1 <span>late</span>"
+
+    # a date after today with reps still required
+    i = dates.index(datetime.date(2025, 1, 11))
+    assert columns["notes"][i] == []
+    assert columns["required"][i] == 1
+    assert tally.format_notes(dates[i]) == "⇨ 1"
@@ -1,3 +1,189 @@
-from django.test import TestCase
+import base64
+import datetime
+import json
+import shutil
+import tempfile
+import threading
+from unittest import mock, skipIf
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import (
+    Client,
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+
+from . import renderers
+from .api import GoalSchema, RepsSchema
+from .models import Goal
+from .tally import Tally
+from .views import goal_status_list, goal_status_v2
+
+TODAY = datetime.date(2025, 1, 10)
+
+
+class TempCacheMixin:
+    @classmethod
+    def setUpClass(cls):
+        cls.cache_dir = tempfile.mkdtemp()
+        cls.cache_settings = override_settings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": cls.cache_dir,
+                }
+            }
+        )
+        cls.cache_settings.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.cache_settings.disable()
+        shutil.rmtree(cls.cache_dir)
+
+
+class CacheInvalidationTest(TempCacheMixin, TestCase):
+    def setUp(self):
+        self.goal_a = Goal.objects.create(goal="a", target=365, notes="")
+        self.goal_b = Goal.objects.create(goal="b", target=365, notes="")
+        self.rep = self.goal_a.reps_set.create(
+            date=datetime.date(2025, 1, 1), count=5
+        )
+        self.goal_b.reps_set.create(date=datetime.date(2025, 1, 2), count=3)
+        # populate the cache before each change
+        self.assertFresh(self.goal_a)
+        self.assertFresh(self.goal_b)
+
+    def assertFresh(self, goal):
+        goal = Goal.objects.get(goal_id=goal.goal_id)
+        tally = Tally.from_reps(goal.reps_set.all(), goal.target, TODAY)
+        self.assertEqual(
+            goal_status_v2(goal, TODAY), tally.status_v2(TODAY, goal.target)
+        )
+        self.assertEqual(goal_status_list(goal, TODAY), tally.status(TODAY))
+
+    def test_rep_create(self):
+        self.goal_a.reps_set.create(date=datetime.date(2025, 1, 9), count=7)
+        self.assertFresh(self.goal_a)
+        self.assertFresh(self.goal_b)
+
+    def test_rep_delete(self):
+        self.rep.delete()
+        self.assertFresh(self.goal_a)
+        self.assertFresh(self.goal_b)
+
+    def test_rep_moved_between_goals(self):
+        self.rep.goal = self.goal_b
+        self.rep.save()
+        self.assertFresh(self.goal_a)
+        self.assertFresh(self.goal_b)
+
+    def test_goal_edit(self):
+        self.goal_a.target = 1000
+        self.goal_a.save()
+        self.assertFresh(self.goal_a)
+        self.assertFresh(self.goal_b)
+
+
+class ConcurrentWritesTest(TempCacheMixin, TransactionTestCase):
+    def test_concurrent_rep_posts(self):
+        User.objects.create_user("user", password="password")
+        goal = Goal.objects.create(goal="a", target=365, notes="")
+        credentials = base64.b64encode(b"user:password").decode()
+        barrier = threading.Barrier(2)
+        status_codes = []
+
+        def post(day):
+            try:
+                client = Client(HTTP_AUTHORIZATION=f"Basic {credentials}")
+                barrier.wait()
+                response = client.post(
+                    f"/goals/{goal.goal_id}/reps",
+                    {"date": f"2025-01-{day:02d}T00:00:00", "count": day},
+                    content_type="application/json",
+                )
+                status_codes.append(response.status_code)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=post, args=(day,)) for day in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(status_codes, [200, 200])
+        self.assertEqual(goal.reps_set.count(), 2)
+        self.assertEqual(
+            goal_status_v2(Goal.objects.get(goal_id=goal.goal_id), TODAY)[0][2], 3
+        )
+
+
+class ListingsTest(TestCase):
+    def setUp(self):
+        self.goal = Goal.objects.create(goal="a", target=365, notes="n")
+        for day, notes in [(1, None), (3, "x"), (2, "y")]:
+            self.goal.reps_set.create(
+                date=datetime.date(2025, 1, day), count=day, notes=notes
+            )
+        self.empty = Goal.objects.create(goal="b", target=365, notes="")
+
+    def test_goals_match_schema(self):
+        response = self.client.get("/goals")
+        expected = [
+            GoalSchema.model_validate(goal).model_dump(mode="json")
+            for goal in Goal.objects.all()
+        ]
+        self.assertEqual(response.json(), expected)
+
+    def test_reps_match_schema(self):
+        response = self.client.get(f"/goals/{self.goal.goal_id}/reps")
+        expected = [
+            RepsSchema.model_validate(rep).model_dump(mode="json")
+            for rep in self.goal.reps_set.order_by("-date")
+        ]
+        self.assertEqual(response.json(), {"items": expected, "count": 3})
+
+    def test_reps_limit_offset(self):
+        response = self.client.get(
+            f"/goals/{self.goal.goal_id}/reps", {"limit": 1, "offset": 1}
+        )
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual([rep["date"] for rep in data["items"]], ["2025-01-02"])
+        response = self.client.get(f"/goals/{self.goal.goal_id}/reps", {"limit": 0})
+        self.assertEqual(response.status_code, 422)
+
+    def test_reps_not_found(self):
+        response = self.client.get(f"/goals/{self.empty.goal_id}/reps")
+        self.assertEqual(response.status_code, 404)
+
+
+class RenderersTest(SimpleTestCase):
+    payloads = [
+        [("Year", -3, 1200, 1000), ("Week", 2, 15, 19)],
+        {"date": [datetime.date(2025, 1, 1)], "notes": [[(3, None), (2, "note")]]},
+        {1: [("Year", -3, 1200, 1000)], 2: []},
+    ]
+
+    @skipIf(renderers.orjson is None, "orjson not installed")
+    def test_fallback_matches_orjson(self):
+        for payload in self.payloads:
+            fast = renderers.dumps(payload)
+            with mock.patch.object(renderers, "orjson", None):
+                fallback = renderers.dumps(payload)
+            self.assertEqual(json.loads(fallback), json.loads(fast))
+
+    def test_renderer_dates_and_tuples(self):
+        content = renderers.FastJSONRenderer().render(
+            None, self.payloads[1], response_status=200
+        )
+        self.assertEqual(
+            json.loads(content),
+            {"date": ["2025-01-01"], "notes": [[[3, None], [2, "note"]]]},
+        )
@@ -1,39 +1,34 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date, timedelta
-from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from django.http import HttpResponse
 from mako.template import Template
+from .cache import cached
 from .models import Goal
+from .renderers import json_response
 from django.shortcuts import get_object_or_404
-from typing import Iterator
+from typing import Any, Dict, Iterable, List, Tuple
 from .tally import Tally, TallyResults
 
 
 def get_goals_status_html(request):
-    today = date.today()
+    today = timezone.localdate()
     return HttpResponse(
         Template(filename="app/templates/goal-status.html").render_unicode(
             title="Yearly Goal Status",
             today=today,
-            goals=[
-                goal_status(goal, today, show_all_dates=False)
-                for goal in Goal.objects.all()
-            ],
+            goals=[goal_recent_status(goal, today) for goal in Goal.objects.all()],
         )
     )
 
 
 def get_goal_status_html(request, goal_id: int):
-    today = date.today()
+    today = timezone.localdate()
     goal = get_object_or_404(Goal, goal_id=goal_id)
     if request.accepts("text/html"):
-        return HttpResponse(
-            Template(filename="app/templates/goal-status.html").render_unicode(
-                title=goal.goal, today=today, goals=[goal_status(goal, today)]
-            )
-        )
+        return HttpResponse(goal_status_html(goal, today))
     else:
-        tally = Tally.from_reps(goal.reps_set.all(), goal.target, today)
-        return JsonResponse(tally.status(today), safe=False)
+        return json_response(goal_status_list(goal, today))
 
 
 @dataclass
@@ -44,7 +39,7 @@ class Status:
     targets: list[tuple[str, int]]
     status: list[tuple[str, int]]
     max_total: float
-    results: Iterator[TallyResults]
+    results: Iterable[TallyResults]
 
 
 def goal_status(goal: Goal, today: date, show_all_dates: bool = True) -> Status:
@@ -63,3 +58,52 @@ def goal_status(goal: Goal, today: date, show_all_dates: bool = True) -> Status:
         tally.max_total,
         tally.results(dates, goal.target, today),
     )
+
+
+def goal_status_html(goal: Goal, today: date) -> str:
+    return cached(
+        goal,
+        today,
+        "html",
+        lambda: Template(filename="app/templates/goal-status.html").render_unicode(
+            title=goal.goal, today=today, goals=[goal_status(goal, today)]
+        ),
+    )
+
+
+def goal_recent_status(goal: Goal, today: date) -> Status:
+    def compute() -> Status:
+        status = goal_status(goal, today, show_all_dates=False)
+        return replace(status, results=list(status.results))
+
+    return cached(goal, today, "status-recent", compute)
+
+
+def goal_status_list(goal: Goal, today: date) -> List[Tuple[str, int]]:
+    return cached(
+        goal,
+        today,
+        "status",
+        lambda: Tally.from_reps(goal.reps_set.all(), goal.target, today).status(
+            today
+        ),
+    )
+
+
+def goal_status_v2(goal: Goal, today: date) -> List[Tuple[str, int, int, int]]:
+    return cached(
+        goal,
+        today,
+        "status-v2",
+        lambda: Tally.from_reps(goal.reps_set.all(), goal.target, today).status_v2(
+            today, goal.target
+        ),
+    )
+
+
+def goal_results_columns(goal: Goal, today: date) -> Dict[str, Any]:
+    def compute() -> Dict[str, Any]:
+        tally = Tally.from_reps(goal.reps_set.all(), goal.target, today)
+        return tally.columns(list(tally.dates()), goal.target)
+
+    return cached(goal, today, "results-columns", compute)
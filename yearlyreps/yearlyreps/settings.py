@@ -81,6 +81,27 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": "/data/yearlyreps2.db",
+        # take the write lock at the start of each write transaction, so
+        # concurrent workers queue on the busy timeout instead of failing
+        "OPTIONS": {"transaction_mode": "IMMEDIATE"},
+        # file based so that tests can use concurrent connections
+        "TEST": {"NAME": "test_yearlyreps2.db"},
+    }
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# file based so that computed tallies are shared between gunicorn workers
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.environ.get("CACHE_DIR", "/data/cache"),
+        "TIMEOUT": 2 * 24 * 60 * 60,
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.environ.get("CACHE_MAX_ENTRIES", 2000)),
+        },
     }
 }
 
@@ -18,9 +18,10 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 from app import views
+from app.renderers import FastJSONRenderer
 from ninja import NinjaAPI
 
-api = NinjaAPI(docs_url="/api/docs")
+api = NinjaAPI(docs_url="/api/docs", renderer=FastJSONRenderer())
 api.title = "Yearly Reps API Documentation"
 
 api.add_router("/", "app.api.router")